@@ -129,7 +129,7 @@ def update_account(id):
     account.update()
 
     return make_response(
-        "Account has been updated",
+        jsonify(account.serialize()),
         status.HTTP_200_OK
     )
 
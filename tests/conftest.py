@@ -0,0 +1,100 @@
+"""
+Shared pytest fixtures for the Account test suites
+"""
+import os
+
+# Run against an in-memory SQLite database when TESTING=1 is set, keeping
+# PostgreSQL as the integration path. This must happen before the service
+# is imported because it connects to DATABASE_URI at import time.
+if os.getenv("TESTING") == "1":
+    os.environ["DATABASE_URI"] = "sqlite:///:memory:"
+
+# pylint: disable=wrong-import-position
+import time  # noqa: E402
+from collections import Counter  # noqa: E402
+import pytest  # noqa: E402
+from service.models import db  # noqa: E402
+from tests.database import (  # noqa: E402
+    TEST_CONFIG, drop_worker_database, get_app, join_session_into_transaction
+)
+
+# Report fixture setup and test teardown totals when PYTEST_TIMING=1 is set
+TIMING = os.getenv("PYTEST_TIMING") == "1"
+TIMINGS = Counter()
+
+
+######################################################################
+#  T I M I N G   H O O K S
+######################################################################
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef):
+    """Adds the setup time of each fixture, setUpClass included, to TIMINGS"""
+    if not TIMING:
+        yield
+        return
+    start = time.perf_counter_ns()
+    yield
+    TIMINGS[f"setup {fixturedef.argname}"] += time.perf_counter_ns() - start
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item):  # pylint: disable=unused-argument
+    """Adds the teardown time of each test, tearDownClass included, to TIMINGS"""
+    if not TIMING:
+        yield
+        return
+    start = time.perf_counter_ns()
+    yield
+    TIMINGS["teardown"] += time.perf_counter_ns() - start
+
+
+def pytest_sessionfinish(session):
+    """Hands a pytest-xdist worker's timings back and drops its database"""
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["timings"] = dict(TIMINGS)
+        drop_worker_database()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node):
+    """Collects the timings of a finished pytest-xdist worker"""
+    TIMINGS.update(getattr(node, "workeroutput", {}).get("timings", {}))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Reports the setup and teardown totals"""
+    if not TIMINGS:
+        return
+    terminalreporter.section("setup and teardown timings")
+    for phase, elapsed in sorted(TIMINGS.items()):
+        terminalreporter.write_line(f"{elapsed / 1e6:10.3f} ms  {phase}")
+
+
+######################################################################
+#  F I X T U R E S
+######################################################################
+
+
+# Not named "app" so pytest-flask does not push a request context per test
+@pytest.fixture(scope="module")
+def test_app():
+    """Returns the configured app, shared by every test in the module"""
+    return get_app(TEST_CONFIG)
+
+
+@pytest.fixture(name="connection", scope="module")
+def connection_fixture(test_app):  # pylint: disable=redefined-outer-name
+    """Opens a database connection that lives for the whole module"""
+    with test_app.app_context():
+        connection = db.engine.connect()
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def db_session(connection):
+    """Yields db.session joined into a transaction that is rolled back"""
+    rollback = join_session_into_transaction(connection)
+    yield db.session
+    rollback()
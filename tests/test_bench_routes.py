@@ -0,0 +1,86 @@
+"""
+Account API Concurrency Benchmarks
+
+The benchmark marker is deselected by setup.cfg, run the benchmarks with:
+  pytest tests/test_bench_routes.py -m benchmark --benchmark-only
+"""
+import time
+import asyncio
+import logging
+import statistics
+import httpx
+import pytest
+from service.models import db, Account
+from tests.database import TEST_CONFIG, clear_accounts, get_app
+from tests.factories import AccountFactory
+
+BASE_URL = "/accounts"
+ACCOUNT_COUNT = 10
+REQUEST_COUNT = 100
+MAX_CONNECTIONS = 100
+# Talisman redirects plain HTTP unless the request claims to be behind TLS
+HTTPS_HEADERS = {"X-Forwarded-Proto": "https"}
+
+
+######################################################################
+#  F I X T U R E S
+######################################################################
+@pytest.fixture(name="app", scope="module")
+def app_fixture():
+    """Returns the configured app with the Accounts read by the live server
+
+    The live server runs in a forked process, so the Accounts are committed
+    and any pooled server connections are dropped before it starts.
+    """
+    test_app = get_app(TEST_CONFIG)
+    test_app.logger.setLevel(logging.CRITICAL)
+
+    accounts = AccountFactory.build_batch(ACCOUNT_COUNT)
+    for account in accounts:
+        account.id = None  # id must be none to generate next primary key
+    db.session.add_all(accounts)
+    db.session.commit()
+    db.session.remove()
+    if db.engine.dialect.name != "sqlite":
+        # disposing the single in-memory SQLite connection would drop the data
+        db.engine.dispose()
+
+    yield test_app
+
+    clear_accounts()
+    db.session.remove()
+
+
+@pytest.fixture(name="account_ids")
+def account_ids_fixture(app):  # pylint: disable=unused-argument
+    """Returns the ids of the seeded Accounts"""
+    return [account.id for account in Account.all()]
+
+
+######################################################################
+#  B E N C H M A R K S
+######################################################################
+@pytest.mark.benchmark(group="concurrent")
+def test_concurrent_reads(benchmark, live_server, account_ids):
+    """It should Read Accounts concurrently from the live server"""
+    base_url = f"http://{live_server.host}:{live_server.port}"
+    ids = [account_ids[i % len(account_ids)] for i in range(REQUEST_COUNT)]
+    latencies = []
+
+    async def read_account(client, account_id):
+        start = time.perf_counter()
+        response = await client.get(f"{BASE_URL}/{account_id}")
+        latencies.append(time.perf_counter() - start)
+        return response.status_code
+
+    async def read_accounts():
+        limits = httpx.Limits(max_connections=MAX_CONNECTIONS)
+        async with httpx.AsyncClient(base_url=base_url, headers=HTTPS_HEADERS, limits=limits) as client:
+            return await asyncio.gather(*[read_account(client, i) for i in ids])
+
+    status_codes = benchmark(lambda: asyncio.run(read_accounts()))
+    assert status_codes == [200] * REQUEST_COUNT
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    benchmark.extra_info["p50"] = percentiles[49]
+    benchmark.extra_info["p95"] = percentiles[94]